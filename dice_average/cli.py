@@ -1,21 +1,19 @@
 """Command-line interface for the dice average calculator."""
 
+import re
 from typing import Optional, Any
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .config import get_config_manager, load_config_with_env
 from .display import (
-    format_roll_result,
+    get_console, format_roll_result,
     format_expression_info, format_config_display,
     print_success
 )
-from .error_handling import handle_cli_error, safe_int_conversion, safe_bool_conversion
+from .error_handling import handle_cli_error
 from .models import OutputFormat
 from .parser import parse_dice_expression, get_expression_info
-from .roller import roll_dice
 
 app = typer.Typer(
     name="dice-average",
@@ -23,7 +21,22 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+# First arguments that go straight to the Typer app
+SUBCOMMANDS = frozenset({"roll", "history", "info", "config", "version"})
+
+# Configuration keys that can be changed with 'config --set'
+CONFIG_KEYS = [
+    "default_iterations", "default_seed", "output_format",
+    "verbose", "show_stats", "history_limit"
+]
+
+# Matches an option flag or an exact subcommand name
+DISPATCH_PATTERN = re.compile(
+    r'^(?:-|(?:' + '|'.join(sorted(SUBCOMMANDS)) + r')\Z)'
+)
+
+# Matches arguments that start with dice notation (e.g. "3d6", "d20+5")
+DICE_ARGUMENT_PATTERN = re.compile(r'^\d*d\d+', re.IGNORECASE)
 
 
 @app.command()
@@ -36,7 +49,6 @@ def roll(
 ) -> None:
     """Roll dice once and show result."""
     config = load_config_with_env()
-    config_manager = get_config_manager()
     
     # Apply configuration defaults
     iterations = 1  # Always single roll
@@ -47,28 +59,15 @@ def roll(
         raise ValueError("Iterations must be a positive number")
     
     # Parse and roll dice
+    from .roller import roll_dice
+
     dice_expr = parse_dice_expression(expression)
-    roll_result = _execute_roll(dice_expr, iterations, seed, expression)
+    roll_result = roll_dice(dice_expr, iterations, seed)[0]
     
     # Output results
     format_roll_result(roll_result, dice_expr, verbose, False)
 
 
-def _execute_roll(dice_expr: Any, iterations: int, seed: Optional[int], 
-                 expression: str) -> Any:
-    """Execute the dice roll with optional progress display."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Rolling {expression}...", total=None)
-        rolls = roll_dice(dice_expr, iterations, seed)
-        progress.update(task, completed=True)
-        return rolls[0]  # Return the first (and only) roll result
-
-
-
 @app.command()
 @handle_cli_error
 def info(
@@ -97,55 +96,77 @@ def config(
         return
     
     if set_key and value:
-        _update_config_value(config_manager, set_key, value)
+        if set_key not in CONFIG_KEYS:
+            raise ValueError(f"Invalid configuration key. Valid keys: {', '.join(CONFIG_KEYS)}")
+        
+        converted_value = _convert_config_value(set_key, value)
+        config_manager.update_config(**{set_key: converted_value})
+        print_success(f"Configuration updated: {set_key} = {converted_value}")
         return
     
     if show or (not set_key and not value):
-        _show_current_config(config_manager)
-
-
-def _update_config_value(config_manager: Any, set_key: str, value: str) -> None:
-    """Update a configuration value."""
-    valid_keys = [
-        "default_iterations", "default_seed", "output_format",
-        "verbose", "show_stats", "history_limit"
-    ]
-    
-    if set_key not in valid_keys:
-        raise ValueError(f"Invalid configuration key. Valid keys: {', '.join(valid_keys)}")
-    
-    # Convert value to appropriate type
-    converted_value = _convert_config_value(set_key, value)
-    
-    config_manager.update_config(**{set_key: converted_value})
-    print_success(f"Configuration updated: {set_key} = {converted_value}")
+        format_config_display(config_manager.load_config(), config_manager.get_config_info())
 
 
 def _convert_config_value(set_key: str, value: str) -> Any:
     """Convert string value to appropriate type for configuration."""
-    if set_key in ["default_iterations", "history_limit"]:
-        return safe_int_conversion(value, set_key)
-    elif set_key == "default_seed":
-        return safe_int_conversion(value, set_key) if value != "null" else None
-    elif set_key in ["verbose", "show_stats"]:
-        return safe_bool_conversion(value)
+    if set_key in ["verbose", "show_stats"]:
+        return value.lower() in ("true", "1", "yes")
+    elif set_key == "default_seed" and value == "null":
+        return None
+    elif set_key in ["default_iterations", "history_limit", "default_seed"]:
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"Invalid {set_key}: '{value}' must be a number")
     elif set_key == "output_format":
         return OutputFormat(value)
     return value
 
 
-def _show_current_config(config_manager: Any) -> None:
-    """Display current configuration."""
-    current_config = config_manager.load_config()
-    config_info = config_manager.get_config_info()
-    format_config_display(current_config, config_info)
+def _parse_fast_roll_args(args: list[str]) -> Optional[dict]:
+    """
+    Parse plain roll arguments without going through Click.
+    
+    Args:
+        args: Command-line arguments, starting with the dice expression
+        
+    Returns:
+        Keyword arguments for ``roll``, or None if Typer should handle them
+    """
+    if not args or not DICE_ARGUMENT_PATTERN.match(args[0]):
+        return None
+    
+    options = {"expression": args[0], "seed": None, "verbose": False, "save": True}
+    remaining = iter(args[1:])
+    
+    for arg in remaining:
+        if arg in ("--verbose", "-v"):
+            options["verbose"] = True
+        elif arg == "--save":
+            options["save"] = True
+        elif arg == "--no-save":
+            options["save"] = False
+        elif arg in ("--seed", "-s"):
+            value = next(remaining, None)
+            if value is None:
+                return None
+            try:
+                options["seed"] = int(value)
+            except ValueError:
+                # Let Click report the bad value
+                return None
+        else:
+            return None
+    
+    return options
 
 
 @app.command()
 def version() -> None:
     """Show version information."""
     from . import __version__
-    console.print(f"dice-average version {__version__}")
+    get_console().print(f"dice-average version {__version__}")
 
 
 def main():
@@ -159,12 +180,20 @@ def main():
     
     # Check if first argument is a known subcommand
     first_arg = sys.argv[1]
-    subcommands = {"history", "info", "config", "version"}
     
-    if first_arg in subcommands or first_arg.startswith('-'):
+    if DISPATCH_PATTERN.match(first_arg):
         # Run as multi-command app
         app()
     else:
+        # Plain dice rolls skip Click parsing entirely
+        fast_roll = _parse_fast_roll_args(sys.argv[1:])
+        if fast_roll is not None:
+            try:
+                roll(**fast_roll)
+            except typer.Exit as e:
+                sys.exit(e.exit_code)
+            return
+        
         # Prepend 'roll' to the arguments and run
         sys.argv.insert(1, 'roll')
         app()
@@ -1,7 +1,7 @@
 """Configuration management for the dice average application."""
 
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +11,10 @@ from .models import AppConfig, OutputFormat
 class ConfigManager:
     """Manages application configuration and persistent data."""
     
+    __slots__ = (
+        "config_dir", "config_file", "history_file", "_config", "_dirty"
+    )
+    
     def __init__(self, config_dir: Optional[Path] = None):
         """
         Initialize the configuration manager.
@@ -29,6 +33,10 @@ class ConfigManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         self._config: Optional[AppConfig] = None
+        # Whether _config differs from a valid config_file: it has unsaved
+        # changes, or it fell back to defaults because the file was missing,
+        # empty or unreadable
+        self._dirty = False
     
     def load_config(self) -> AppConfig:
         """
@@ -40,16 +48,20 @@ class ConfigManager:
         if self._config is not None:
             return self._config
         
-        if self.config_file.exists():
+        config_exists, config_size = _stat_file(self.config_file)
+        
+        # An empty file holds no settings, so skip reading and parsing it
+        if config_exists and config_size > 0:
             try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                self._config = AppConfig.model_validate(config_data)
-            except (json.JSONDecodeError, Exception) as e:
+                with open(self.config_file, 'rb') as f:
+                    self._config = AppConfig.model_validate_json(f.read())
+            except (ValueError, OSError) as e:
                 print(f"Warning: Could not load config file: {e}")
                 self._config = AppConfig()
+                self._dirty = True
         else:
             self._config = AppConfig()
+            self._dirty = True
         
         return self._config
     
@@ -62,13 +74,19 @@ class ConfigManager:
         """
         if config is not None:
             self._config = config
+            self._dirty = True
         
-        if self._config is None:
+        if self._config is None or not self._dirty:
             return
         
+        # Write to a temporary file and swap it in so a failed write never
+        # leaves a truncated config behind
+        tmp_file = self.config_file.with_suffix(".json.tmp")
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self._config.model_dump(), f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(self._config.model_dump_json(indent=2).encode())
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
         except Exception as e:
             print(f"Warning: Could not save config file: {e}")
     
@@ -84,11 +102,10 @@ class ConfigManager:
         """
         config = self.load_config()
         
-        # Create new config with updated values
-        config_data = config.model_dump()
-        config_data.update(kwargs)
-        
-        self._config = AppConfig.model_validate(config_data)
+        updated = _with_updates(config, kwargs)
+        if updated != config:
+            self._config = updated
+            self._dirty = True
         self.save_config()
         
         return self._config
@@ -96,20 +113,22 @@ class ConfigManager:
     
     def get_config_info(self) -> dict:
         """Get information about configuration files."""
+        config_exists, config_size = _stat_file(self.config_file)
+        history_exists, history_size = _stat_file(self.history_file)
+        
         return {
             "config_dir": str(self.config_dir),
             "config_file": str(self.config_file),
             "history_file": str(self.history_file),
-            "config_exists": self.config_file.exists(),
-            "history_exists": self.history_file.exists(),
-            "config_size": self.config_file.stat().st_size if self.config_file.exists() else 0,
-            "history_size": self.history_file.stat().st_size if self.history_file.exists() else 0,
+            "config_exists": config_exists,
+            "history_exists": history_exists,
+            "config_size": config_size,
+            "history_size": history_size,
         }
     
     def reset_config(self) -> AppConfig:
         """Reset configuration to defaults."""
-        self._config = AppConfig()
-        self.save_config()
+        self.save_config(AppConfig())
         return self._config
     
     def import_config(self, config_path: Path) -> AppConfig:
@@ -126,19 +145,20 @@ class ConfigManager:
             FileNotFoundError: If config file doesn't exist
             ValueError: If config file is invalid
         """
-        if not config_path.exists():
+        try:
+            with open(config_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {config_path}")
+        except OSError as e:
+            raise ValueError(f"Invalid config file: {e}")
         
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
-            
-            config = AppConfig.model_validate(config_data)
-            self._config = config
-            self.save_config()
+            config = AppConfig.model_validate_json(raw)
+            self.save_config(config)
             
             return config
-        except (json.JSONDecodeError, Exception) as e:
+        except ValueError as e:
             raise ValueError(f"Invalid config file: {e}")
     
     def export_config(self, export_path: Path) -> None:
@@ -151,22 +171,32 @@ class ConfigManager:
         config = self.load_config()
         
         try:
-            with open(export_path, 'w') as f:
-                json.dump(config.model_dump(), f, indent=2)
+            with open(export_path, 'wb') as f:
+                f.write(config.model_dump_json(indent=2).encode())
         except Exception as e:
             raise ValueError(f"Could not export config: {e}")
 
 
-# Global configuration manager instance
-_config_manager: Optional[ConfigManager] = None
+def _with_updates(config: AppConfig, updates: dict) -> AppConfig:
+    """Return a copy of config with updates applied, validating only those fields."""
+    updated = config.model_copy()
+    for key, value in updates.items():
+        AppConfig.__pydantic_validator__.validate_assignment(updated, key, value)
+    return updated
 
 
+def _stat_file(path: Path) -> tuple[bool, int]:
+    """Return (exists, size) for a file using a single stat call."""
+    try:
+        return True, os.stat(path).st_size
+    except FileNotFoundError:
+        return False, 0
+
+
+@lru_cache(maxsize=1)
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance."""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    return ConfigManager()
 
 
 def load_config() -> AppConfig:
@@ -181,21 +211,35 @@ def save_config(config: AppConfig) -> None:
 
 
 
+def _parse_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean."""
+    return value.lower() in ("true", "1", "yes")
+
+
+# Environment variable -> (config key, converter)
+ENV_MAPPINGS = (
+    ("DICE_DEFAULT_ITERATIONS", "default_iterations", int),
+    ("DICE_DEFAULT_SEED", "default_seed", int),
+    ("DICE_OUTPUT_FORMAT", "output_format", OutputFormat),
+    ("DICE_VERBOSE", "verbose", _parse_bool),
+    ("DICE_SHOW_STATS", "show_stats", _parse_bool),
+    ("DICE_HISTORY_LIMIT", "history_limit", int),
+)
+
+
 def get_config_from_env() -> dict:
     """Get configuration overrides from environment variables."""
+    env_values = tuple(os.environ.get(env_var) for env_var, _, _ in ENV_MAPPINGS)
+    # Copy so callers can't modify the cached overrides
+    return dict(_convert_env_values(env_values))
+
+
+@lru_cache(maxsize=8)
+def _convert_env_values(env_values: tuple) -> dict:
+    """Convert raw environment values (in ENV_MAPPINGS order) to config overrides."""
     config_overrides = {}
     
-    # Environment variable mappings
-    env_mappings = {
-        "DICE_DEFAULT_ITERATIONS": ("default_iterations", int),
-        "DICE_DEFAULT_SEED": ("default_seed", int),
-        "DICE_OUTPUT_FORMAT": ("output_format", OutputFormat),
-        "DICE_VERBOSE": ("verbose", lambda x: x.lower() in ("true", "1", "yes")),
-        "DICE_SHOW_STATS": ("show_stats", lambda x: x.lower() in ("true", "1", "yes")),
-    }
-    
-    for env_var, (config_key, converter) in env_mappings.items():
-        value = os.environ.get(env_var)
+    for (env_var, config_key, converter), value in zip(ENV_MAPPINGS, env_values):
         if value is not None:
             try:
                 config_overrides[config_key] = converter(value)
@@ -211,8 +255,6 @@ def load_config_with_env() -> AppConfig:
     env_overrides = get_config_from_env()
     
     if env_overrides:
-        config_data = config.model_dump()
-        config_data.update(env_overrides)
-        config = AppConfig.model_validate(config_data)
+        config = _with_updates(config, env_overrides)
     
     return config
\ No newline at end of file
@@ -1,31 +1,49 @@
 """Display and formatting utilities for the dice average calculator."""
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
 
 from .models import RollResult, DiceExpression
 from .parser import DiceParseError
 
-console = Console()
+# Column (header, style) definitions for the tables built below
+KEY_VALUE_COLUMNS = (("Property", "cyan"), ("Value", "magenta"))
+CONFIG_COLUMNS = (("Setting", "cyan"), ("Value", "magenta"))
+DICE_BREAKDOWN_COLUMNS = (
+    ("Count", "cyan"),
+    ("Sides", "magenta"),
+    ("Min", "yellow"),
+    ("Max", "green"),
+    ("Average", "blue"),
+)
+
+# Shared console instance, created on first use
+_console: Optional[Console] = None
+
+
+def get_console() -> Console:
+    """Get the shared console instance."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
 
 
 def handle_parse_error(expression: str, error: DiceParseError) -> None:
     """Handle dice parsing errors with helpful messages."""
-    console.print(f"[red]Error parsing dice expression:[/red] {expression}")
-    console.print(f"[red]{error}[/red]")
-    console.print("\n[yellow]Supported formats:[/yellow]")
-    
     examples = [
         "d6", "3d6", "2d20+5", "1d8+2d6", "4d6-2", "d20 + 3"
     ]
     
-    for example in examples:
-        console.print(f"  • {example}")
+    lines = [
+        f"[red]Error parsing dice expression:[/red] {expression}",
+        f"[red]{error}[/red]",
+        "\n[yellow]Supported formats:[/yellow]",
+    ]
+    lines.extend(f"  • {example}" for example in examples)
+    get_console().print("\n".join(lines))
 
 
 def format_roll_result(roll: RollResult, expression: DiceExpression, verbose: bool = False, 
@@ -36,57 +54,70 @@ def format_roll_result(roll: RollResult, expression: DiceExpression, verbose: bo
 
 def _format_single_roll(roll: RollResult, expression: DiceExpression, verbose: bool) -> None:
     """Format output for a single roll."""
-    console.print(f"\n[bold green]Rolling {expression}[/bold green]")
+    lines = [f"\n[bold green]Rolling {expression}[/bold green]"]
     
     if verbose:
-        _show_roll_breakdown(roll, expression)
+        lines.extend(_roll_breakdown_lines(roll, expression))
     
-    console.print(f"[bold blue]Result: {roll.total}[/bold blue]")
-    console.print(f"[dim]Theoretical Average: {expression.average_value:.2f}[/dim]")
-
-
+    lines.append(f"[bold blue]Result: {roll.total}[/bold blue]")
+    lines.append(f"[dim]Theoretical Average: {expression.average_value:.2f}[/dim]")
+    
+    # One print call means one markup parse and one write
+    get_console().print("\n".join(lines))
 
 
-def _show_roll_breakdown(roll, expression: DiceExpression) -> None:
-    """Show detailed breakdown of individual dice rolls."""
-    for i, group_rolls in enumerate(roll.individual_rolls):
-        group = expression.dice_groups[i]
-        rolls_str = " + ".join(str(r) for r in group_rolls)
-        console.print(f"  {group.count}d{group.die.sides}: [{rolls_str}] = {sum(group_rolls)}")
+def _roll_breakdown_lines(roll, expression: DiceExpression) -> List[str]:
+    """Build the detailed breakdown of individual dice rolls."""
+    lines = []
+    for group, group_rolls in zip(expression.dice_groups, roll.individual_rolls):
+        rolls_str = " + ".join(map(str, group_rolls))
+        lines.append(f"  {group.count}d{group.die.sides}: [{rolls_str}] = {sum(group_rolls)}")
     
     if roll.modifier != 0:
-        console.print(f"  Modifier: {roll.modifier:+d}")
-
-
-
-
-
-
-
-
-
-
+        lines.append(f"  Modifier: {roll.modifier:+d}")
+    
+    return lines
 
 
+def _build_table(columns: Tuple[Tuple[str, str], ...], rows: List[Tuple[str, ...]],
+                 title: Optional[str] = None) -> Any:
+    """
+    Build a Rich table from column definitions and pre-formatted rows.
+    
+    Args:
+        columns: (header, style) pairs, one per column
+        rows: Cell values for each row, already converted to strings
+        title: Optional table title
+        
+    Returns:
+        Rich Table ready to print
+    """
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    
+    for row in rows:
+        table.add_row(*row)
+    
+    return table
 
 
 def format_expression_info(expression: str, info_data: Dict[str, Any]) -> None:
     """Format and display expression information."""
-    console.print(f"\n[bold green]Expression Info: {expression}[/bold green]")
-    
-    info_table = Table()
-    info_table.add_column("Property", style="cyan")
-    info_table.add_column("Value", style="magenta")
-    
-    info_table.add_row("Parsed Expression", info_data["expression"])
-    info_table.add_row("Dice Groups", str(info_data["dice_groups"]))
-    info_table.add_row("Total Dice", str(info_data["total_dice"]))
-    info_table.add_row("Modifier", str(info_data["modifier"]))
-    info_table.add_row("Min Value", str(info_data["min_value"]))
-    info_table.add_row("Max Value", str(info_data["max_value"]))
-    info_table.add_row("Average Value", f"{info_data['average_value']:.2f}")
+    get_console().print(f"\n[bold green]Expression Info: {expression}[/bold green]")
     
-    console.print(info_table)
+    rows = [
+        ("Parsed Expression", info_data["expression"]),
+        ("Dice Groups", str(info_data["dice_groups"])),
+        ("Total Dice", str(info_data["total_dice"])),
+        ("Modifier", str(info_data["modifier"])),
+        ("Min Value", str(info_data["min_value"])),
+        ("Max Value", str(info_data["max_value"])),
+        ("Average Value", f"{info_data['average_value']:.2f}"),
+    ]
+    get_console().print(_build_table(KEY_VALUE_COLUMNS, rows))
     
     if info_data["dice_types"]:
         _show_dice_breakdown(info_data["dice_types"])
@@ -94,60 +125,53 @@ def format_expression_info(expression: str, info_data: Dict[str, Any]) -> None:
 
 def _show_dice_breakdown(dice_types) -> None:
     """Display dice breakdown table."""
-    dice_table = Table(title="Dice Breakdown")
-    dice_table.add_column("Count", style="cyan")
-    dice_table.add_column("Sides", style="magenta")
-    dice_table.add_column("Min", style="yellow")
-    dice_table.add_column("Max", style="green")
-    dice_table.add_column("Average", style="blue")
-    
-    for dice_type in dice_types:
-        dice_table.add_row(
+    rows = [
+        (
             str(dice_type["count"]),
             str(dice_type["sides"]),
             str(dice_type["min"]),
             str(dice_type["max"]),
             f"{dice_type['average']:.2f}",
         )
-    
-    console.print(dice_table)
+        for dice_type in dice_types
+    ]
+    get_console().print(_build_table(DICE_BREAKDOWN_COLUMNS, rows, title="Dice Breakdown"))
 
 
 def format_config_display(current_config, config_info) -> None:
     """Format and display configuration information."""
-    console.print("[bold green]Current Configuration[/bold green]")
+    get_console().print("[bold green]Current Configuration[/bold green]")
     
-    config_table = Table()
-    config_table.add_column("Setting", style="cyan")
-    config_table.add_column("Value", style="magenta")
-    
-    config_table.add_row("Default Iterations", str(current_config.default_iterations))
-    config_table.add_row("Default Seed", str(current_config.default_seed))
-    config_table.add_row("Output Format", current_config.output_format.value)
-    config_table.add_row("Verbose", str(current_config.verbose))
-    config_table.add_row("Show Stats", str(current_config.show_stats))
-    config_table.add_row("History Limit", str(current_config.history_limit))
-    
-    console.print(config_table)
+    rows = [
+        ("Default Iterations", str(current_config.default_iterations)),
+        ("Default Seed", str(current_config.default_seed)),
+        ("Output Format", current_config.output_format.value),
+        ("Verbose", str(current_config.verbose)),
+        ("Show Stats", str(current_config.show_stats)),
+        ("History Limit", str(current_config.history_limit)),
+    ]
+    get_console().print(_build_table(CONFIG_COLUMNS, rows))
     
-    console.print(f"\n[bold blue]Configuration Files[/bold blue]")
-    console.print(f"Config Dir: {config_info['config_dir']}")
-    console.print(f"Config File: {config_info['config_file']} ({'exists' if config_info['config_exists'] else 'missing'})")
-    console.print(f"History File: {config_info['history_file']} ({'exists' if config_info['history_exists'] else 'missing'})")
+    get_console().print("\n".join([
+        "\n[bold blue]Configuration Files[/bold blue]",
+        f"Config Dir: {config_info['config_dir']}",
+        f"Config File: {config_info['config_file']} ({'exists' if config_info['config_exists'] else 'missing'})",
+        f"History File: {config_info['history_file']} ({'exists' if config_info['history_exists'] else 'missing'})",
+    ]))
 
 
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[green]{message}[/green]")
+    get_console().print(f"[green]{message}[/green]")
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[red]Error:[/red] {message}")
+    get_console().print(f"[red]Error:[/red] {message}")
 
 
 def print_json(data: Dict[str, Any]) -> None:
     """Print JSON data with proper formatting."""
-    console.print(json.dumps(data, indent=2))
\ No newline at end of file
+    get_console().print(json.dumps(data, indent=2))
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Data models for dice rolling using Pydantic v2."""
 
 from datetime import datetime
-from typing import List, Optional, Union
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -14,7 +15,23 @@ class OutputFormat(str, Enum):
     TABLE = "table"
 
 
-class Die(BaseModel):
+class _CachedModel(BaseModel):
+    """Base for frozen models whose derived values are cached_property attributes."""
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None,
+                   deep: bool = False) -> "_CachedModel":
+        """Copy the model, dropping cached values that an update may invalidate."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # cached_property stores its values in __dict__, which
+            # model_copy copies along with the fields
+            fields = type(self).model_fields
+            for name in [name for name in copied.__dict__ if name not in fields]:
+                del copied.__dict__[name]
+        return copied
+
+
+class Die(_CachedModel):
     """Represents a single die with specified number of sides."""
     model_config = ConfigDict(frozen=True)
     
@@ -30,70 +47,87 @@ class Die(BaseModel):
         """Maximum possible value for this die."""
         return self.sides
     
-    @property
+    @cached_property
     def average_value(self) -> float:
         """Average value for this die."""
         return (self.min_value + self.max_value) / 2
 
 
-class DiceGroup(BaseModel):
+@lru_cache(maxsize=64)
+def get_die(sides: int) -> Die:
+    """
+    Get the shared Die with the given number of sides.
+    
+    Die is frozen, so one validated instance per size can be reused
+    everywhere instead of building a new one each time.
+    """
+    return Die(sides=sides)
+
+
+class DiceGroup(_CachedModel):
     """Represents a group of identical dice (e.g., 3d6)."""
     model_config = ConfigDict(frozen=True)
     
     count: int = Field(gt=0, description="Number of dice in the group")
     die: Die = Field(description="The type of die in this group")
     
-    @property
+    @cached_property
     def min_value(self) -> int:
         """Minimum possible value for this dice group."""
         return self.count * self.die.min_value
     
-    @property
+    @cached_property
     def max_value(self) -> int:
         """Maximum possible value for this dice group."""
         return self.count * self.die.max_value
     
-    @property
+    @cached_property
     def average_value(self) -> float:
         """Average value for this dice group."""
         return self.count * self.die.average_value
 
 
-class DiceExpression(BaseModel):
+class DiceExpression(_CachedModel):
     """Represents a complete dice expression (e.g., 2d6 + 1d8 + 3)."""
     model_config = ConfigDict(frozen=True)
     
-    dice_groups: List[DiceGroup] = Field(description="List of dice groups")
+    dice_groups: Tuple[DiceGroup, ...] = Field(description="Dice groups, in order")
     modifier: int = Field(default=0, description="Static modifier to add")
     
-    @property
+    @cached_property
     def min_value(self) -> int:
         """Minimum possible value for this expression."""
         return sum(group.min_value for group in self.dice_groups) + self.modifier
     
-    @property
+    @cached_property
     def max_value(self) -> int:
         """Maximum possible value for this expression."""
         return sum(group.max_value for group in self.dice_groups) + self.modifier
     
-    @property
+    @cached_property
     def average_value(self) -> float:
         """Average value for this expression."""
         return sum(group.average_value for group in self.dice_groups) + self.modifier
     
-    def __str__(self) -> str:
-        """String representation of the dice expression."""
-        parts = []
-        for group in self.dice_groups:
-            parts.append(f"{group.count}d{group.die.sides}")
-        
-        result = " + ".join(parts)
+    @cached_property
+    def group_specs(self) -> Tuple[Tuple[int, int], ...]:
+        """(count, sides) for each dice group, for loops that only need the numbers."""
+        return tuple((group.count, group.die.sides) for group in self.dice_groups)
+    
+    @cached_property
+    def notation(self) -> str:
+        """Normalised dice notation for this expression (e.g. '2d6 + 1d8 + 3')."""
+        result = " + ".join(f"{group.count}d{group.die.sides}" for group in self.dice_groups)
         if self.modifier > 0:
             result += f" + {self.modifier}"
         elif self.modifier < 0:
             result += f" - {abs(self.modifier)}"
         
         return result
+    
+    def __str__(self) -> str:
+        """String representation of the dice expression."""
+        return self.notation
 
 
 class RollResult(BaseModel):
@@ -1,9 +1,10 @@
 """Parser for dice notation expressions."""
 
 import re
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List
 
-from .models import Die, DiceGroup, DiceExpression
+from .models import DiceGroup, DiceExpression, get_die
 
 
 class DiceParseError(Exception):
@@ -14,10 +15,11 @@ class DiceParseError(Exception):
 class DiceParser:
     """Parser for dice notation expressions like '3d6', '2d20+5', etc."""
     
-    # Regex patterns for parsing dice notation
-    DICE_PATTERN = re.compile(r'(\d*)d(\d+)', re.IGNORECASE)
-    MODIFIER_PATTERN = re.compile(r'([+-])\s*(\d+)(?!d)', re.IGNORECASE)
-    WHITESPACE_PATTERN = re.compile(r'\s+')
+    # One token per match: an optional sign followed by dice or a number.
+    # [0-9] rather than \d so non-ASCII digits are rejected
+    TOKEN_PATTERN = re.compile(
+        r'(?P<sign>[+-])?(?:(?P<count>[0-9]*)d(?P<sides>[0-9]+)|(?P<number>[0-9]+))'
+    )
     
     @classmethod
     def parse(cls, expression: str) -> DiceExpression:
@@ -36,66 +38,62 @@ class DiceParser:
         if not expression or not expression.strip():
             raise DiceParseError("Empty expression")
         
-        # Clean up the expression
-        expression = cls.WHITESPACE_PATTERN.sub('', expression.strip())
-        
-        # Check for invalid characters early
-        import string
-        valid_chars = set(string.digits + 'dD+- ')
-        if not set(expression).issubset(valid_chars):
-            invalid_chars = set(expression) - valid_chars
-            raise DiceParseError(f"Invalid characters in expression: {''.join(sorted(invalid_chars))}")
-        
-        # Check for negative dice count (leading minus before d)
-        if re.search(r'-\d*[dD]\d+', expression):
-            raise DiceParseError("Negative dice counts are not allowed")
+        # Clean up the expression; equivalent spellings share a cache entry
+        return cls._parse_normalized(''.join(expression.split()).lower())
+    
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _parse_normalized(cls, expression: str) -> DiceExpression:
+        """
+        Parse a whitespace-free, lowercase expression, caching the result.
         
-        # Find all dice groups
+        DiceExpression is frozen and keeps its groups in a tuple, so the
+        cached instance is safely shared.
+        Failed parses raise and are therefore not cached.
+        """
         dice_groups = []
-        dice_matches = cls.DICE_PATTERN.findall(expression)
-        
-        if not dice_matches:
-            raise DiceParseError(f"No valid dice notation found in '{expression}'")
+        modifier = 0
+        position = 0
         
-        for count_str, sides_str in dice_matches:
+        # Tokenize in a single left-to-right scan; tokens must be contiguous
+        for match in cls.TOKEN_PATTERN.finditer(expression):
+            if match.start() != position:
+                break
+            position = match.end()
+            
+            sign, count_str, sides_str, number_str = match.group(
+                'sign', 'count', 'sides', 'number'
+            )
             try:
-                count = int(count_str) if count_str else 1
-                sides = int(sides_str)
-                
-                if count <= 0:
-                    raise DiceParseError(f"Dice count must be positive, got {count}")
-                if sides <= 0:
-                    raise DiceParseError(f"Dice sides must be positive, got {sides}")
+                if sides_str is None:
+                    value = int(number_str)
+                    modifier += -value if sign == '-' else value
+                    continue
                 
-                die = Die(sides=sides)
-                dice_group = DiceGroup(count=count, die=die)
-                dice_groups.append(dice_group)
+                if sign == '-':
+                    raise DiceParseError("Negative dice counts are not allowed")
                 
+                count = int(count_str) if count_str else 1
+                sides = int(sides_str)
             except ValueError as e:
                 raise DiceParseError(f"Invalid number in dice notation: {e}")
+            
+            if count <= 0:
+                raise DiceParseError(f"Dice count must be positive, got {count}")
+            if sides <= 0:
+                raise DiceParseError(f"Dice sides must be positive, got {sides}")
+            
+            # count and sides are already checked positive ints, so skip
+            # re-running the model validators
+            dice_groups.append(DiceGroup.model_construct(count=count, die=get_die(sides)))
         
-        # Parse modifier
-        modifier = cls._parse_modifier(expression)
-        
-        return DiceExpression(dice_groups=dice_groups, modifier=modifier)
-    
-    @classmethod
-    def _parse_modifier(cls, expression: str) -> int:
-        """Parse the modifier part of a dice expression."""
-        modifier = 0
-        modifier_matches = cls.MODIFIER_PATTERN.findall(expression)
+        if position != len(expression):
+            raise DiceParseError(f"Invalid syntax in expression at '{expression[position:]}'")
         
-        for sign, value_str in modifier_matches:
-            try:
-                value = int(value_str)
-                if sign == '+':
-                    modifier += value
-                elif sign == '-':
-                    modifier -= value
-            except ValueError:
-                raise DiceParseError(f"Invalid modifier value: {value_str}")
+        if not dice_groups:
+            raise DiceParseError(f"No valid dice notation found in '{expression}'")
         
-        return modifier
+        return DiceExpression.model_construct(dice_groups=tuple(dice_groups), modifier=modifier)
     
     @classmethod
     def validate_expression(cls, expression: str) -> bool:
@@ -114,6 +112,11 @@ class DiceParser:
         except DiceParseError:
             return False
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Discard all cached parse results."""
+        cls._parse_normalized.cache_clear()
+    
     @classmethod
     def get_supported_formats(cls) -> List[str]:
         """Get examples of supported dice notation formats."""
@@ -132,6 +135,9 @@ def parse_dice_expression(expression: str) -> DiceExpression:
     """
     Convenience function to parse a dice expression.
     
+    Results are cached by DiceParser, so repeated expressions return the
+    same frozen DiceExpression instance.
+    
     Args:
         expression: Dice notation string
         
@@ -172,22 +178,26 @@ def get_expression_info(expression: str) -> dict:
     """
     dice_expr = parse_dice_expression(expression)
     
+    # One pass over the groups; the value aggregates are cached properties
+    total_dice = 0
+    dice_types = []
+    for group in dice_expr.dice_groups:
+        total_dice += group.count
+        dice_types.append({
+            "count": group.count,
+            "sides": group.die.sides,
+            "min": group.min_value,
+            "max": group.max_value,
+            "average": group.average_value,
+        })
+    
     return {
         "expression": str(dice_expr),
         "dice_groups": len(dice_expr.dice_groups),
-        "total_dice": sum(group.count for group in dice_expr.dice_groups),
+        "total_dice": total_dice,
         "modifier": dice_expr.modifier,
         "min_value": dice_expr.min_value,
         "max_value": dice_expr.max_value,
         "average_value": dice_expr.average_value,
-        "dice_types": [
-            {
-                "count": group.count,
-                "sides": group.die.sides,
-                "min": group.min_value,
-                "max": group.max_value,
-                "average": group.average_value,
-            }
-            for group in dice_expr.dice_groups
-        ],
+        "dice_types": dice_types,
     }
\ No newline at end of file
@@ -1,7 +1,10 @@
 """Dice rolling logic and utilities."""
 
 import random
-from typing import List, Optional, Tuple
+from collections import Counter, OrderedDict
+from datetime import datetime
+from operator import add
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 from .models import DiceExpression, RollResult
 
@@ -9,6 +12,14 @@ from .models import DiceExpression, RollResult
 class DiceRoller:
     """Handles dice rolling operations."""
     
+    # Maximum number of rolls drawn per choices() call in batch methods
+    BATCH_SIZE = 4096
+    
+    # choices() picks faces with floor(random() * sides), which can't reach
+    # every face of larger dice (and len() of their range overflows), so
+    # those are rolled with randint() instead
+    MAX_CHOICES_SIDES = 2 ** 53
+    
     def __init__(self, seed: Optional[int] = None):
         """
         Initialize the dice roller.
@@ -29,23 +40,35 @@ class DiceRoller:
         Returns:
             RollResult with the outcome
         """
+        individual_rolls, total = self._roll_groups(expression)
+        return self._make_result(expression, individual_rolls, total)
+    
+    def _roll_groups(self, expression: DiceExpression) -> Tuple[List[List[int]], int]:
+        """Roll every dice group once, returning the rolls and the total."""
         individual_rolls = []
+        total = expression.modifier
         
-        for group in expression.dice_groups:
-            group_rolls = []
-            for _ in range(group.count):
-                roll = self.random.randint(1, group.die.sides)
-                group_rolls.append(roll)
+        for count, sides in expression.group_specs:
+            group_rolls = self._roll_dice(sides, count)
             individual_rolls.append(group_rolls)
+            total += sum(group_rolls)
         
-        # Calculate total
-        total = sum(sum(rolls) for rolls in individual_rolls) + expression.modifier
-        
-        return RollResult(
+        return individual_rolls, total
+    
+    @staticmethod
+    def _make_result(expression: DiceExpression, individual_rolls: List[List[int]],
+                     total: int) -> RollResult:
+        """Build a RollResult from rolls produced by _roll_groups."""
+        # Every field is produced here with its final type, so skip validation.
+        # The timestamp is passed explicitly because model_construct inspects
+        # a default_factory's signature on every call, which costs far more
+        # than the validation being skipped
+        return RollResult.model_construct(
             expression=expression,
             individual_rolls=individual_rolls,
             modifier=expression.modifier,
-            total=total
+            total=total,
+            timestamp=datetime.now(),
         )
     
     def roll_multiple(self, expression: DiceExpression, iterations: int) -> List[RollResult]:
@@ -62,13 +85,80 @@ class DiceRoller:
         if iterations <= 0:
             raise ValueError("Iterations must be positive")
         
+        modifier = expression.modifier
         rolls = []
-        for _ in range(iterations):
-            roll = self.roll_single(expression)
-            rolls.append(roll)
+        for size, group_rolls in self._roll_batches(expression, iterations):
+            # group_rolls holds one flat list per group, with each roll's
+            # dice stored consecutively
+            split_groups = [
+                [flat[i:i + count] for i in range(0, len(flat), count)]
+                for (count, _), flat in zip(expression.group_specs, group_rolls)
+            ]
+            # Expressions without dice still give one (empty) roll per iteration
+            per_roll = zip(*split_groups) if split_groups else [()] * size
+            for individual in per_roll:
+                individual_rolls = list(individual)
+                total = modifier + sum(map(sum, individual_rolls))
+                rolls.append(self._make_result(expression, individual_rolls, total))
         
         return rolls
     
+    def roll_totals(self, expression: DiceExpression, iterations: int) -> List[int]:
+        """
+        Roll a dice expression multiple times, keeping only the totals.
+        
+        Draws the same random values in the same order as roll_multiple, but
+        skips building a RollResult for every roll.
+        
+        Args:
+            expression: The dice expression to roll
+            iterations: Number of times to roll
+            
+        Returns:
+            List of roll totals
+        """
+        if iterations <= 0:
+            raise ValueError("Iterations must be positive")
+        
+        totals = []
+        for size, group_rolls in self._roll_batches(expression, iterations):
+            batch_totals = [0] * size
+            for (count, _), flat in zip(expression.group_specs, group_rolls):
+                # Sum each run of `count` consecutive dice
+                group_totals = flat if count == 1 else map(sum, zip(*[iter(flat)] * count))
+                batch_totals = list(map(add, batch_totals, group_totals))
+            
+            modifier = expression.modifier
+            totals.extend(map(modifier.__add__, batch_totals) if modifier else batch_totals)
+        
+        return totals
+    
+    def _roll_batches(self, expression: DiceExpression,
+                      iterations: int) -> Iterator[Tuple[int, List[List[int]]]]:
+        """
+        Roll an expression in batches of up to BATCH_SIZE iterations.
+        
+        For each batch, yields the batch size and one flat list per dice
+        group holding count * batch_size dice, drawn with a single choices()
+        call so the per-call overhead is paid once per group instead of once
+        per roll.
+        """
+        for start in range(0, iterations, self.BATCH_SIZE):
+            size = min(self.BATCH_SIZE, iterations - start)
+            yield size, [
+                self._roll_dice(sides, count * size)
+                for count, sides in expression.group_specs
+            ]
+    
+    def _roll_dice(self, sides: int, k: int) -> List[int]:
+        """Roll k dice with the given number of sides."""
+        if sides > self.MAX_CHOICES_SIDES:
+            randint = self.random.randint
+            return [randint(1, sides) for _ in range(k)]
+        
+        # choices() draws all k dice in one call instead of one randint() per die
+        return self.random.choices(range(1, sides + 1), k=k)
+    
     def roll_with_target(self, expression: DiceExpression, target: int, 
                         max_attempts: int = 10000) -> Tuple[RollResult, int]:
         """
@@ -88,10 +178,11 @@ class DiceRoller:
         if target < expression.min_value or target > expression.max_value:
             raise ValueError(f"Target {target} is impossible for expression {expression}")
         
+        # Only the matching attempt needs a RollResult
         for attempt in range(1, max_attempts + 1):
-            roll = self.roll_single(expression)
-            if roll.total == target:
-                return roll, attempt
+            individual_rolls, total = self._roll_groups(expression)
+            if total == target:
+                return self._make_result(expression, individual_rolls, total), attempt
         
         raise ValueError(f"Could not reach target {target} in {max_attempts} attempts")
     
@@ -137,9 +228,39 @@ def roll_dice_once(expression: DiceExpression,
 class DiceSimulator:
     """Advanced dice simulation utilities."""
     
+    # Number of seeded results kept by the simulation cache
+    CACHE_SIZE = 128
+    
     def __init__(self, seed: Optional[int] = None):
         """Initialize the simulator."""
         self.roller = DiceRoller(seed=seed)
+        self._cache: OrderedDict = OrderedDict()
+    
+    def _simulate(self, key: tuple, simulation: Callable[[DiceRoller], Any]) -> Any:
+        """
+        Run a simulation, memoizing seeded results.
+        
+        With a seed, each simulation runs on a fresh roller seeded the same
+        way, so its result depends only on its arguments and the seed and can
+        be cached. Without a seed, every call draws new rolls.
+        """
+        seed = self.roller.seed
+        if seed is None:
+            return simulation(self.roller)
+        
+        key = (*key, seed)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            self._cache[key] = simulation(DiceRoller(seed=seed))
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        
+        return self._cache[key]
+    
+    def clear_cache(self) -> None:
+        """Discard all memoized simulation results."""
+        self._cache.clear()
     
     def simulate_outcomes(self, expression: DiceExpression, 
                          iterations: int = 10000) -> dict[int, int]:
@@ -153,13 +274,11 @@ class DiceSimulator:
         Returns:
             Dictionary mapping outcomes to their counts
         """
-        outcomes = {}
-        
-        for _ in range(iterations):
-            roll = self.roller.roll_single(expression)
-            outcomes[roll.total] = outcomes.get(roll.total, 0) + 1
-        
-        return outcomes
+        outcomes = self._simulate(
+            ("outcomes", expression.notation, iterations),
+            lambda roller: Counter(roller.roll_totals(expression, iterations)),
+        )
+        return dict(outcomes)
     
     def find_probability_empirical(self, expression: DiceExpression, 
                                   target: int, iterations: int = 10000) -> float:
@@ -177,13 +296,10 @@ class DiceSimulator:
         if target < expression.min_value or target > expression.max_value:
             return 0.0
         
-        hits = 0
-        for _ in range(iterations):
-            roll = self.roller.roll_single(expression)
-            if roll.total == target:
-                hits += 1
-        
-        return hits / iterations
+        return self._simulate(
+            ("probability", expression.notation, target, iterations),
+            lambda roller: roller.roll_totals(expression, iterations).count(target) / iterations,
+        )
     
     def compare_expressions(self, expr1: DiceExpression, expr2: DiceExpression,
                            iterations: int = 10000) -> dict:
@@ -198,13 +314,22 @@ class DiceSimulator:
         Returns:
             Dictionary with comparison results
         """
-        rolls1 = self.roller.roll_multiple(expr1, iterations)
-        rolls2 = self.roller.roll_multiple(expr2, iterations)
-        
-        expr1_wins = sum(1 for r1, r2 in zip(rolls1, rolls2) 
-                        if r1.total > r2.total)
-        expr2_wins = sum(1 for r1, r2 in zip(rolls1, rolls2) 
-                        if r2.total > r1.total)
+        comparison = self._simulate(
+            ("compare", expr1.notation, expr2.notation, iterations),
+            lambda roller: self._compare_totals(
+                expr1, expr2, iterations,
+                roller.roll_totals(expr1, iterations),
+                roller.roll_totals(expr2, iterations),
+            ),
+        )
+        return dict(comparison)
+    
+    @staticmethod
+    def _compare_totals(expr1: DiceExpression, expr2: DiceExpression, iterations: int,
+                        totals1: List[int], totals2: List[int]) -> dict:
+        """Summarize paired totals from two expressions."""
+        expr1_wins = sum(1 for t1, t2 in zip(totals1, totals2) if t1 > t2)
+        expr2_wins = sum(1 for t1, t2 in zip(totals1, totals2) if t2 > t1)
         ties = iterations - expr1_wins - expr2_wins
         
         return {
@@ -217,6 +342,6 @@ class DiceSimulator:
             "expr1_win_rate": expr1_wins / iterations,
             "expr2_win_rate": expr2_wins / iterations,
             "tie_rate": ties / iterations,
-            "expr1_avg": sum(r.total for r in rolls1) / len(rolls1),
-            "expr2_avg": sum(r.total for r in rolls2) / len(rolls2),
+            "expr1_avg": sum(totals1) / iterations,
+            "expr2_avg": sum(totals2) / iterations,
         }
\ No newline at end of file
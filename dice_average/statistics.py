@@ -0,0 +1,168 @@
+"""Exact probability calculations for dice expressions."""
+
+from functools import lru_cache
+from math import comb
+from typing import Dict, List, Sequence, Tuple
+
+from .models import DiceExpression
+
+
+class DiceStatistics:
+    """Calculates exact probability distributions for dice expressions."""
+    
+    # Convolutions with at least this many term products are done by
+    # packing both lists into big integers and multiplying those
+    PACKED_CONVOLUTION_THRESHOLD = 256
+    
+    @classmethod
+    def calculate_distribution(cls, expression: DiceExpression) -> Dict[int, float]:
+        """
+        Calculate the exact probability of every possible total.
+        
+        Args:
+            expression: The dice expression to analyze
+        
+        Returns:
+            Dictionary mapping each possible total to its probability, in
+            ascending order of total
+        """
+        # Copy so callers can't modify the cached distribution
+        return dict(cls._cached_distribution(expression.group_specs, expression.modifier))
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _cached_distribution(cls, group_specs: Tuple[Tuple[int, int], ...],
+                             modifier: int) -> Dict[int, float]:
+        """Calculate the distribution for (count, sides) groups plus a modifier."""
+        # Count the ways to reach each total, then divide by the number of
+        # equally likely outcomes so probabilities stay exact until the end.
+        # ways[i] counts the rolls totalling (lowest + i)
+        lowest = modifier
+        ways: Sequence[int] = [1]
+        outcomes = 1
+        
+        for count, sides in group_specs:
+            ways = cls._convolve_distributions(ways, cls._group_ways(sides, count))
+            lowest += count
+            outcomes *= sides ** count
+        
+        return {
+            lowest + i: ways_count / outcomes
+            for i, ways_count in enumerate(ways)
+            if ways_count
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _group_ways(sides: int, count: int) -> Tuple[int, ...]:
+        """
+        Count the ways each total can be rolled by `count` dice with `sides` sides.
+        
+        Index i of the result counts the rolls totalling (count + i).
+        """
+        size = count * (sides - 1) + 1
+        # The distribution is symmetric, so only the lower half is computed
+        half = (size + 1) // 2
+        
+        # Closed form for the sum of identical dice: the coefficients of
+        # (1 - x**sides)**count / (1 - x)**count, i.e.
+        #   ways[i] = sum_j (-1)**j * C(count, j) * C(i - j*sides + count - 1, count - 1)
+        # stars[m] holds C(m + count - 1, count - 1)
+        stars = [1] * half
+        for m in range(1, half):
+            stars[m] = stars[m - 1] * (m + count - 1) // m
+        
+        ways = stars[:]
+        for j in range(1, min(count, (half - 1) // sides) + 1):
+            coefficient = comb(count, j)
+            if j % 2:
+                coefficient = -coefficient
+            offset = j * sides
+            for i in range(offset, half):
+                ways[i] += coefficient * stars[i - offset]
+        
+        return tuple(ways + ways[:size - half][::-1])
+    
+    @classmethod
+    def _convolve_distributions(cls, first: Sequence[int],
+                                second: Sequence[int]) -> List[int]:
+        """Combine two independent way-count lists by summing totals."""
+        if len(first) * len(second) >= cls.PACKED_CONVOLUTION_THRESHOLD:
+            return cls._packed_convolve(first, second)
+        
+        result = [0] * (len(first) + len(second) - 1)
+        for i, ways1 in enumerate(first):
+            if ways1:
+                for j, ways2 in enumerate(second, i):
+                    result[j] += ways1 * ways2
+        return result
+    
+    @staticmethod
+    def _packed_convolve(first: Sequence[int], second: Sequence[int]) -> List[int]:
+        """
+        Convolve way-count lists with one big-integer multiplication.
+        
+        Each list becomes the digits of an integer in base 2**(8*width), with
+        digits wide enough that no coefficient of the product can carry into
+        its neighbour. The product's digits are then exactly the convolution,
+        and CPython's subquadratic integer multiply does the work in C.
+        """
+        bits = (max(first).bit_length() + max(second).bit_length()
+                + min(len(first), len(second)).bit_length())
+        width = (bits + 7) // 8
+        length = len(first) + len(second) - 1
+        
+        def pack(ways: Sequence[int]) -> int:
+            return int.from_bytes(
+                b"".join(count.to_bytes(width, "little") for count in ways), "little"
+            )
+        
+        product = (pack(first) * pack(second)).to_bytes(length * width, "little")
+        return [
+            int.from_bytes(product[i:i + width], "little")
+            for i in range(0, length * width, width)
+        ]
+    
+    @classmethod
+    def exact_probability(cls, expression: DiceExpression, target: int) -> float:
+        """
+        Calculate the exact probability of rolling a specific total.
+        
+        Args:
+            expression: The dice expression to analyze
+            target: Target total
+        
+        Returns:
+            Probability (0.0 to 1.0)
+        """
+        if target < expression.min_value or target > expression.max_value:
+            return 0.0
+        distribution = cls._cached_distribution(expression.group_specs, expression.modifier)
+        return distribution.get(target, 0.0)
+
+
+def calculate_distribution(expression: DiceExpression) -> Dict[int, float]:
+    """
+    Convenience function to calculate an exact probability distribution.
+    
+    Args:
+        expression: The dice expression to analyze
+    
+    Returns:
+        Dictionary mapping each possible total to its probability
+    """
+    return DiceStatistics.calculate_distribution(expression)
+
+
+def exact_probability(expression: DiceExpression, target: int) -> float:
+    """
+    Convenience function to calculate the exact probability of a total.
+    
+    Args:
+        expression: The dice expression to analyze
+        target: Target total
+    
+    Returns:
+        Probability (0.0 to 1.0)
+    """
+    return DiceStatistics.exact_probability(expression, target)
\ No newline at end of file
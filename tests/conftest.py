@@ -0,0 +1,66 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from dice_average.models import DiceExpression, DiceGroup, get_die
+from dice_average.roller import DiceSimulator
+
+# Simulator shared by the seeded_simulator fixture
+_simulator = DiceSimulator()
+
+
+def pytest_addoption(parser):
+    """Add the --runslow option."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="needs --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Expressions are frozen, so one instance can be shared by every test
+@pytest.fixture(scope="session")
+def expr_1d6():
+    """A single six-sided die."""
+    return DiceExpression(dice_groups=[DiceGroup(count=1, die=get_die(6))])
+
+
+@pytest.fixture(scope="session")
+def expr_2d6():
+    """Two six-sided dice."""
+    return DiceExpression(dice_groups=[DiceGroup(count=2, die=get_die(6))])
+
+
+@pytest.fixture(scope="session")
+def expr_3d6():
+    """Three six-sided dice."""
+    return DiceExpression(dice_groups=[DiceGroup(count=3, die=get_die(6))])
+
+
+@pytest.fixture(scope="session")
+def expr_2d6_plus_5():
+    """Two six-sided dice plus 5."""
+    return DiceExpression(dice_groups=[DiceGroup(count=2, die=get_die(6))], modifier=5)
+
+
+@pytest.fixture(scope="session")
+def expr_1d8():
+    """A single eight-sided die."""
+    return DiceExpression(dice_groups=[DiceGroup(count=1, die=get_die(8))])
+
+
+@pytest.fixture
+def seeded_simulator():
+    """The shared simulator, reseeded with 42 and with an empty cache."""
+    _simulator.roller.set_seed(42)
+    _simulator.clear_cache()
+    return _simulator
\ No newline at end of file
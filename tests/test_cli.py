@@ -3,15 +3,17 @@
 import pytest
 from typer.testing import CliRunner
 
-from dice_average.cli import app
+from dice_average.cli import app, main, _parse_fast_roll_args
+from dice_average.parser import parse_dice_expression
 
 
 class TestCLI:
     """Test CLI functionality."""
     
-    def setup_method(self):
-        """Set up test runner."""
-        self.runner = CliRunner()
+    @classmethod
+    def setup_class(cls):
+        """Set up a test runner shared by the whole class."""
+        cls.runner = CliRunner()
     
     def _invoke_main(self, args):
         """Helper to invoke the main CLI behavior."""
@@ -98,6 +100,16 @@ class TestCLI:
         assert result.exit_code == 1
         assert "Invalid configuration key" in result.stdout
     
+    def test_config_command_set_invalid_number(self):
+        """Test config command with a non-numeric value for an int key."""
+        result = self.runner.invoke(app, [
+            "config", 
+            "--set", "default_iterations",
+            "--value", "many"
+        ])
+        assert result.exit_code == 1
+        assert "must be a number" in result.stdout
+    
     def test_roll_command_no_save(self):
         """Test roll command without saving to history."""
         result = self._invoke_main([
@@ -105,7 +117,7 @@ class TestCLI:
             "--no-save"
         ])
         assert result.exit_code == 0
-        assert "Rolling d6" in result.stdout
+        assert "Rolling 1d6" in result.stdout
     
     def test_roll_command_no_stats(self):
         """Test roll command without statistics."""
@@ -113,23 +125,22 @@ class TestCLI:
             "d6"
         ])
         assert result.exit_code == 0
-        assert "Rolling d6" in result.stdout
-    
-    def test_complex_dice_expressions(self):
+        assert "Rolling 1d6" in result.stdout
+    
+    @pytest.mark.parametrize("expr", [
+        "d6",
+        "3d6",
+        "2d8+5",
+        "1d20-3",
+        "2d6+1d8+3",
+        "4d6-2",
+    ])
+    def test_complex_dice_expressions(self, expr):
         """Test various complex dice expressions."""
-        expressions = [
-            "d6",
-            "3d6",
-            "2d8+5",
-            "1d20-3",
-            "2d6+1d8+3",
-            "4d6-2",
-        ]
-        
-        for expr in expressions:
-            result = self._invoke_main([expr])
-            assert result.exit_code == 0, f"Failed for expression: {expr}"
-            assert f"Rolling {expr}" in result.stdout or expr in result.stdout
+        result = self._invoke_main([expr])
+        assert result.exit_code == 0, f"Failed for expression: {expr}"
+        parsed = parse_dice_expression(expr)
+        assert f"Rolling {parsed}" in result.stdout
     
     def test_help_messages(self):
         """Test help messages."""
@@ -167,4 +178,44 @@ class TestCLI:
         
         # Complex expression
         result = self._invoke_main(["10d6+5d8+3d4-10"])
-        assert result.exit_code == 0
\ No newline at end of file
+        assert result.exit_code == 0
+    
+    def test_parse_fast_roll_args(self):
+        """Test parsing plain roll arguments without Click."""
+        assert _parse_fast_roll_args(["3d6"]) == {
+            "expression": "3d6", "seed": None, "verbose": False, "save": True
+        }
+        
+        options = _parse_fast_roll_args(["2d8+3", "--seed", "42", "-v", "--no-save"])
+        assert options == {
+            "expression": "2d8+3", "seed": 42, "verbose": True, "save": False
+        }
+    
+    def test_parse_fast_roll_args_falls_back(self):
+        """Test that anything unusual is left to Typer."""
+        assert _parse_fast_roll_args([]) is None
+        assert _parse_fast_roll_args(["invalid"]) is None
+        assert _parse_fast_roll_args(["d6", "--seed"]) is None
+        assert _parse_fast_roll_args(["d6", "--seed", "invalid"]) is None
+        assert _parse_fast_roll_args(["d6", "--help"]) is None
+    
+    def test_main_fast_path(self, monkeypatch, capsys):
+        """Test that main rolls plain expressions directly."""
+        monkeypatch.setattr("sys.argv", ["dice-average", "3d6", "--seed", "42"])
+        main()
+        assert "Rolling 3d6" in capsys.readouterr().out
+    
+    def test_main_fast_path_invalid_expression(self, monkeypatch):
+        """Test that fast path errors exit with status 1."""
+        monkeypatch.setattr("sys.argv", ["dice-average", "3d0"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 1
+    
+    def test_main_explicit_roll_subcommand(self, monkeypatch, capsys):
+        """Test that an explicit 'roll' is not treated as an expression."""
+        monkeypatch.setattr("sys.argv", ["dice-average", "roll", "2d4"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 0
+        assert "Rolling 2d4" in capsys.readouterr().out
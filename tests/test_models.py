@@ -4,10 +4,23 @@ import pytest
 from datetime import datetime
 
 from dice_average.models import (
-    Die, DiceGroup, DiceExpression, RollResult, AppConfig, OutputFormat
+    Die, DiceGroup, DiceExpression, RollResult, AppConfig, OutputFormat, get_die
 )
 
 
+# Die is frozen, so one instance per size can be shared by every test
+@pytest.fixture(scope="module")
+def d6():
+    """A six-sided die."""
+    return get_die(6)
+
+
+@pytest.fixture(scope="module")
+def d8():
+    """An eight-sided die."""
+    return get_die(8)
+
+
 class TestDie:
     """Test Die model."""
     
@@ -19,12 +32,20 @@ class TestDie:
         assert die.max_value == 6
         assert die.average_value == 3.5
     
-    def test_die_validation(self):
+    @pytest.mark.parametrize("sides", [0, -1])
+    def test_die_validation(self, sides):
         """Test die validation."""
         with pytest.raises(ValueError):
-            Die(sides=0)
+            Die(sides=sides)
+    
+    def test_get_die_shared(self):
+        """Test that get_die returns one shared instance per size."""
+        assert get_die(6) is get_die(6)
+        assert get_die(6) == Die(sides=6)
+        assert get_die(8) is not get_die(6)
+        
         with pytest.raises(ValueError):
-            Die(sides=-1)
+            get_die(0)
     
     def test_die_immutable(self):
         """Test that die is immutable."""
@@ -37,32 +58,28 @@ class TestDie:
 class TestDiceGroup:
     """Test DiceGroup model."""
     
-    def test_dice_group_creation(self):
+    def test_dice_group_creation(self, d6):
         """Test creating a dice group."""
-        die = Die(sides=6)
-        group = DiceGroup(count=3, die=die)
+        group = DiceGroup(count=3, die=d6)
         assert group.count == 3
         assert group.die.sides == 6
         assert group.min_value == 3
         assert group.max_value == 18
         assert group.average_value == 10.5
     
-    def test_dice_group_validation(self):
+    @pytest.mark.parametrize("count", [0, -1])
+    def test_dice_group_validation(self, d6, count):
         """Test dice group validation."""
-        die = Die(sides=6)
         with pytest.raises(ValueError):
-            DiceGroup(count=0, die=die)
-        with pytest.raises(ValueError):
-            DiceGroup(count=-1, die=die)
+            DiceGroup(count=count, die=d6)
 
 
 class TestDiceExpression:
     """Test DiceExpression model."""
     
-    def test_simple_expression(self):
+    def test_simple_expression(self, d6):
         """Test simple dice expression."""
-        die = Die(sides=6)
-        group = DiceGroup(count=3, die=die)
+        group = DiceGroup(count=3, die=d6)
         expr = DiceExpression(dice_groups=[group])
         
         assert expr.min_value == 3
@@ -70,10 +87,9 @@ class TestDiceExpression:
         assert expr.average_value == 10.5
         assert "3d6" in str(expr)
     
-    def test_expression_with_modifier(self):
+    def test_expression_with_modifier(self, d6):
         """Test expression with modifier."""
-        die = Die(sides=6)
-        group = DiceGroup(count=2, die=die)
+        group = DiceGroup(count=2, die=d6)
         expr = DiceExpression(dice_groups=[group], modifier=5)
         
         assert expr.min_value == 7
@@ -82,26 +98,78 @@ class TestDiceExpression:
         assert "2d6" in str(expr)
         assert "+5" in str(expr) or "+ 5" in str(expr)
     
-    def test_complex_expression(self):
+    def test_complex_expression(self, d6, d8):
         """Test complex expression with multiple dice groups."""
-        die6 = Die(sides=6)
-        die8 = Die(sides=8)
-        group1 = DiceGroup(count=2, die=die6)
-        group2 = DiceGroup(count=1, die=die8)
+        group1 = DiceGroup(count=2, die=d6)
+        group2 = DiceGroup(count=1, die=d8)
         expr = DiceExpression(dice_groups=[group1, group2], modifier=-1)
         
         assert expr.min_value == 2  # 2 + 1 - 1
         assert expr.max_value == 19  # 12 + 8 - 1
         assert expr.average_value == 10.5  # 7 + 4.5 - 1
+    
+    def test_notation(self, d6, d8):
+        """Test the normalised notation string."""
+        group1 = DiceGroup(count=2, die=d6)
+        group2 = DiceGroup(count=1, die=d8)
+        expr = DiceExpression(dice_groups=[group1, group2], modifier=-3)
+        
+        assert expr.notation == "2d6 + 1d8 - 3"
+        assert str(expr) == expr.notation
+        
+        copied = expr.model_copy(update={"modifier": 4})
+        assert copied.notation == "2d6 + 1d8 + 4"
+        assert str(copied) == "2d6 + 1d8 + 4"
+    
+    def test_group_specs(self, d6, d8):
+        """Test the (count, sides) pairs for each group."""
+        group1 = DiceGroup(count=2, die=d6)
+        group2 = DiceGroup(count=1, die=d8)
+        expr = DiceExpression(dice_groups=[group1, group2], modifier=-3)
+        
+        assert expr.group_specs == ((2, 6), (1, 8))
+    
+    def test_cached_values_do_not_affect_equality(self, d8):
+        """Test that cached derived values leave equality unchanged."""
+        group = DiceGroup(count=2, die=d8)
+        expr = DiceExpression(dice_groups=[group], modifier=1)
+        other = DiceExpression(dice_groups=[group], modifier=1)
+        
+        assert expr.average_value == 10.0
+        assert expr.average_value == 10.0
+        assert expr == other
+        assert expr.model_dump() == other.model_dump()
+    
+    def test_expression_hashable(self, d6):
+        """Test that equal expressions hash equally."""
+        expr = DiceExpression(dice_groups=[DiceGroup(count=2, die=d6)], modifier=1)
+        other = DiceExpression(dice_groups=(DiceGroup(count=2, die=d6),), modifier=1)
+        
+        assert hash(expr) == hash(other)
+        assert len({expr, other}) == 1
+    
+    def test_model_copy_recomputes_cached_values(self, d6):
+        """Test that copies with updated fields don't keep stale cached values."""
+        expr = DiceExpression(dice_groups=[DiceGroup(count=2, die=d6)], modifier=1)
+        assert expr.max_value == 13
+        
+        copied = expr.model_copy(update={"modifier": 10})
+        assert copied.min_value == 12
+        assert copied.max_value == 22
+        assert copied.average_value == 17.0
+        assert expr.max_value == 13
+        
+        group = DiceGroup(count=2, die=d6)
+        assert group.max_value == 12
+        assert group.model_copy(update={"count": 3}).max_value == 18
 
 
 class TestRollResult:
     """Test RollResult model."""
     
-    def test_roll_result_creation(self):
+    def test_roll_result_creation(self, d6):
         """Test creating a roll result."""
-        die = Die(sides=6)
-        group = DiceGroup(count=2, die=die)
+        group = DiceGroup(count=2, die=d6)
         expr = DiceExpression(dice_groups=[group])
         
         roll = RollResult(
@@ -115,10 +183,9 @@ class TestRollResult:
         assert roll.group_totals == [8]
         assert isinstance(roll.timestamp, datetime)
     
-    def test_roll_result_with_modifier(self):
+    def test_roll_result_with_modifier(self, d6):
         """Test roll result with modifier."""
-        die = Die(sides=6)
-        group = DiceGroup(count=1, die=die)
+        group = DiceGroup(count=1, die=d6)
         expr = DiceExpression(dice_groups=[group], modifier=3)
         
         roll = RollResult(
@@ -167,15 +234,14 @@ class TestAppConfig:
         assert config.output_format == OutputFormat.JSON
         assert config.verbose is True
         assert config.show_stats is False
-        
-        # Invalid iterations
-        with pytest.raises(ValueError):
-            AppConfig(default_iterations=0)
-        
-        
-        # Invalid seed
-        with pytest.raises(ValueError):
-            AppConfig(default_seed=-1)
-        
+    
+    @pytest.mark.parametrize("kwargs", [
+        {"default_iterations": 0},
+        {"history_limit": 0},
+        {"default_seed": -1},
+        {"default_seed": 2**32},
+    ])
+    def test_config_validation_invalid(self, kwargs):
+        """Test that out-of-range configuration values are rejected."""
         with pytest.raises(ValueError):
-            AppConfig(default_seed=2**32)
\ No newline at end of file
+            AppConfig(**kwargs)
\ No newline at end of file
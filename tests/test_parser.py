@@ -78,32 +78,28 @@ class TestDiceParser:
         
         assert expr.modifier == -2
     
-    def test_whitespace_handling(self):
+    @pytest.mark.parametrize("expr_str", [
+        "3d6+5",
+        "3d6 + 5",
+        " 3d6 + 5 ",
+        "3d6+  5",
+        "3d6 +5",
+    ])
+    def test_whitespace_handling(self, expr_str):
         """Test handling of whitespace."""
-        expressions = [
-            "3d6+5",
-            "3d6 + 5",
-            " 3d6 + 5 ",
-            "3d6+  5",
-            "3d6 +5",
-        ]
-        
-        for expr_str in expressions:
-            expr = DiceParser.parse(expr_str)
-            assert len(expr.dice_groups) == 1
-            assert expr.dice_groups[0].count == 3
-            assert expr.dice_groups[0].die.sides == 6
-            assert expr.modifier == 5
-    
-    def test_case_insensitive(self):
+        expr = DiceParser.parse(expr_str)
+        assert len(expr.dice_groups) == 1
+        assert expr.dice_groups[0].count == 3
+        assert expr.dice_groups[0].die.sides == 6
+        assert expr.modifier == 5
+    
+    @pytest.mark.parametrize("expr_str", ["3d6", "3D6"])
+    def test_case_insensitive(self, expr_str):
         """Test case insensitive parsing."""
-        expressions = ["3d6", "3D6", "3d6", "3D6"]
-        
-        for expr_str in expressions:
-            expr = DiceParser.parse(expr_str)
-            assert len(expr.dice_groups) == 1
-            assert expr.dice_groups[0].count == 3
-            assert expr.dice_groups[0].die.sides == 6
+        expr = DiceParser.parse(expr_str)
+        assert len(expr.dice_groups) == 1
+        assert expr.dice_groups[0].count == 3
+        assert expr.dice_groups[0].die.sides == 6
     
     def test_multiple_modifiers(self):
         """Test parsing with multiple modifiers."""
@@ -113,23 +109,35 @@ class TestDiceParser:
         assert expr.dice_groups[0].die.sides == 6
         assert expr.modifier == 4  # +3 -1 +2 = +4
     
-    def test_invalid_expressions(self):
+    def test_multi_digit_dice_after_sign(self):
+        """Test that a signed multi-digit dice count is not read as a modifier."""
+        expr = DiceParser.parse("2d6+10d6")
+        assert len(expr.dice_groups) == 2
+        assert expr.dice_groups[1].count == 10
+        assert expr.modifier == 0
+    
+    @pytest.mark.parametrize("expr_str", [
+        pytest.param("", id="empty"),
+        pytest.param("   ", id="blank"),
+        pytest.param("3x6", id="wrong_separator"),
+        pytest.param("0d6", id="zero_count"),
+        pytest.param("3d0", id="zero_sides"),
+        pytest.param("-1d6", id="negative_count"),
+        pytest.param("3d-6", id="negative_sides"),
+        pytest.param("abc", id="no_dice"),
+        pytest.param("3d6 + abc", id="invalid_modifier"),
+        pytest.param("3d6+", id="dangling_sign"),
+        pytest.param("3d6+-2", id="plus_minus"),
+        pytest.param("3d6--2", id="double_minus"),
+        pytest.param("3d6++2", id="double_plus"),
+        pytest.param("\u0663d6", id="arabic_indic_count"),
+        pytest.param("\uff13d6", id="fullwidth_count"),
+        pytest.param("3d6+\u0663", id="arabic_indic_modifier"),
+    ])
+    def test_invalid_expressions(self, expr_str):
         """Test parsing invalid expressions."""
-        invalid_expressions = [
-            "",
-            "   ",
-            "3x6",  # Wrong separator
-            "0d6",  # Zero count
-            "3d0",  # Zero sides
-            "-1d6",  # Negative count
-            "3d-6",  # Negative sides
-            "abc",  # No dice notation
-            "3d6 + abc",  # Invalid modifier
-        ]
-        
-        for expr_str in invalid_expressions:
-            with pytest.raises(DiceParseError):
-                DiceParser.parse(expr_str)
+        with pytest.raises(DiceParseError):
+            DiceParser.parse(expr_str)
     
     def test_edge_cases(self):
         """Test edge cases."""
@@ -152,6 +160,19 @@ class TestDiceParser:
         assert DiceParser.validate_expression("invalid") is False
         assert DiceParser.validate_expression("") is False
     
+    def test_parse_cache(self):
+        """Test that equivalent expressions share one cached parse."""
+        DiceParser.clear_cache()
+        
+        expr = DiceParser.parse("2d6 + 3")
+        assert DiceParser.parse("2d6+3") is expr
+        assert DiceParser.validate_expression(" 2d6+ 3 ") is True
+        assert DiceParser.parse("2D6+3") is expr
+        assert DiceParser._parse_normalized.cache_info().misses == 1
+        
+        DiceParser.clear_cache()
+        assert DiceParser.parse("2d6+3") is not expr
+    
     def test_get_supported_formats(self):
         """Test getting supported formats."""
         formats = DiceParser.get_supported_formats()
@@ -170,6 +191,21 @@ class TestConvenienceFunctions:
         assert len(expr.dice_groups) == 1
         assert expr.modifier == 2
     
+    def test_parse_dice_expression_cached(self):
+        """Test that repeated parses return the cached expression."""
+        assert parse_dice_expression("4d6-1") is parse_dice_expression("4d6-1")
+        
+        # The shared instance can't be modified by one caller
+        expr = parse_dice_expression("4d6-1")
+        assert isinstance(expr.dice_groups, tuple)
+        with pytest.raises(AttributeError):
+            expr.dice_groups.append(expr.dice_groups[0])
+        
+        # Failures are not cached
+        for _ in range(2):
+            with pytest.raises(DiceParseError):
+                parse_dice_expression("4d0")
+    
     def test_validate_dice_expression(self):
         """Test validate_dice_expression convenience function."""
         assert validate_dice_expression("3d6") is True
@@ -216,4 +252,14 @@ class TestConvenienceFunctions:
         # Second dice type (1d8)
         dice_type2 = info["dice_types"][1]
         assert dice_type2["count"] == 1
-        assert dice_type2["sides"] == 8
\ No newline at end of file
+        assert dice_type2["sides"] == 8
+    
+    def test_get_expression_info_returns_copy(self):
+        """Test that expression info is not shared between callers."""
+        first = get_expression_info("2d6+1")
+        first["total_dice"] = 99
+        first["dice_types"][0]["sides"] = 99
+        
+        info = get_expression_info("2d6 + 1")
+        assert info["total_dice"] == 2
+        assert info["dice_types"][0]["sides"] == 6
\ No newline at end of file
@@ -18,44 +18,32 @@ class TestDiceRoller:
         roller_with_seed = DiceRoller(seed=42)
         assert roller_with_seed.seed == 42
     
-    def test_single_roll(self):
+    def test_single_roll(self, expr_1d6):
         """Test rolling a single die."""
-        die = Die(sides=6)
-        group = DiceGroup(count=1, die=die)
-        expr = DiceExpression(dice_groups=[group])
-        
         roller = DiceRoller(seed=42)
-        result = roller.roll_single(expr)
+        result = roller.roll_single(expr_1d6)
         
         assert isinstance(result, RollResult)
-        assert result.expression == expr
+        assert result.expression == expr_1d6
         assert len(result.individual_rolls) == 1
         assert len(result.individual_rolls[0]) == 1
         assert 1 <= result.individual_rolls[0][0] <= 6
         assert result.total == result.individual_rolls[0][0]
     
-    def test_multiple_dice_single_roll(self):
+    def test_multiple_dice_single_roll(self, expr_3d6):
         """Test rolling multiple dice once."""
-        die = Die(sides=6)
-        group = DiceGroup(count=3, die=die)
-        expr = DiceExpression(dice_groups=[group])
-        
         roller = DiceRoller(seed=42)
-        result = roller.roll_single(expr)
+        result = roller.roll_single(expr_3d6)
         
         assert len(result.individual_rolls) == 1
         assert len(result.individual_rolls[0]) == 3
         assert all(1 <= roll <= 6 for roll in result.individual_rolls[0])
         assert result.total == sum(result.individual_rolls[0])
     
-    def test_roll_with_modifier(self):
+    def test_roll_with_modifier(self, expr_2d6_plus_5):
         """Test rolling with modifier."""
-        die = Die(sides=6)
-        group = DiceGroup(count=2, die=die)
-        expr = DiceExpression(dice_groups=[group], modifier=5)
-        
         roller = DiceRoller(seed=42)
-        result = roller.roll_single(expr)
+        result = roller.roll_single(expr_2d6_plus_5)
         
         dice_total = sum(result.individual_rolls[0])
         assert result.total == dice_total + 5
@@ -79,58 +67,113 @@ class TestDiceRoller:
         expected_total = sum(result.individual_rolls[0]) + sum(result.individual_rolls[1])
         assert result.total == expected_total
     
-    def test_roll_multiple(self):
+    def test_roll_multiple(self, expr_1d6):
         """Test rolling multiple times."""
-        die = Die(sides=6)
-        group = DiceGroup(count=1, die=die)
-        expr = DiceExpression(dice_groups=[group])
-        
         roller = DiceRoller(seed=42)
-        rolls = roller.roll_multiple(expr, 10)
+        rolls = roller.roll_multiple(expr_1d6, 10)
         
         assert isinstance(rolls, list)
         assert len(rolls) == 10
         assert all(isinstance(roll, RollResult) for roll in rolls)
-        assert all(roll.expression == expr for roll in rolls)
+        assert all(roll.expression == expr_1d6 for roll in rolls)
     
-    def test_roll_multiple_zero_iterations(self):
-        """Test rolling with zero iterations."""
-        die = Die(sides=6)
-        group = DiceGroup(count=1, die=die)
-        expr = DiceExpression(dice_groups=[group])
+    def test_roll_totals(self):
+        """Test that roll_totals matches roll_multiple for the same seed."""
+        expr = parse_dice_expression("2d6+1d4-1")
+        
+        totals = DiceRoller(seed=42).roll_totals(expr, 50)
+        rolls = DiceRoller(seed=42).roll_multiple(expr, 50)
         
+        assert totals == [roll.total for roll in rolls]
+        
+        with pytest.raises(ValueError):
+            DiceRoller().roll_totals(expr, 0)
+    
+    def test_batches_across_boundary(self):
+        """Test batched rolls that don't fill the final batch."""
+        expr = parse_dice_expression("3d6+1d4+2")
+        
+        roller1 = DiceRoller(seed=42)
+        roller2 = DiceRoller(seed=42)
+        roller1.BATCH_SIZE = roller2.BATCH_SIZE = 7
+        
+        rolls = roller1.roll_multiple(expr, 25)
+        totals = roller2.roll_totals(expr, 25)
+        
+        assert len(rolls) == 25
+        assert totals == [roll.total for roll in rolls]
+        assert all(
+            [len(group) for group in roll.individual_rolls] == [3, 1]
+            for roll in rolls
+        )
+        assert all(
+            roll.total == sum(map(sum, roll.individual_rolls)) + 2
+            for roll in rolls
+        )
+    
+    def test_roll_expression_without_dice(self):
+        """Test that a modifier-only expression still rolls every iteration."""
+        expr = DiceExpression(dice_groups=[], modifier=3)
+        
+        rolls = DiceRoller(seed=42).roll_multiple(expr, 5)
+        assert len(rolls) == 5
+        assert all(roll.total == 3 and roll.individual_rolls == [] for roll in rolls)
+        
+        assert DiceRoller(seed=42).roll_totals(expr, 5) == [3] * 5
+        assert DiceSimulator(seed=42).simulate_outcomes(expr, 5) == {3: 5}
+    
+    def test_roll_huge_dice(self):
+        """Test dice with more sides than choices() can sample evenly."""
+        sides = 10 ** 20
+        expr = parse_dice_expression(f"2d{sides}")
+        
+        result = DiceRoller(seed=42).roll_single(expr)
+        assert all(1 <= roll <= sides for roll in result.individual_rolls[0])
+        
+        rolls = DiceRoller(seed=42).roll_multiple(expr, 5)
+        totals = DiceRoller(seed=42).roll_totals(expr, 5)
+        assert totals == [roll.total for roll in rolls]
+    
+    def test_roll_multiple_zero_iterations(self, expr_1d6):
+        """Test rolling with zero iterations."""
         roller = DiceRoller()
         with pytest.raises(ValueError):
-            roller.roll_multiple(expr, 0)
+            roller.roll_multiple(expr_1d6, 0)
     
-    def test_roll_with_target(self):
+    def test_roll_with_target(self, expr_1d6):
         """Test rolling until target is reached."""
-        die = Die(sides=6)
-        group = DiceGroup(count=1, die=die)
-        expr = DiceExpression(dice_groups=[group])
-        
         roller = DiceRoller(seed=42)
-        result, attempts = roller.roll_with_target(expr, 3)
+        result, attempts = roller.roll_with_target(expr_1d6, 3)
         
         assert result.total == 3
         assert attempts >= 1
         assert attempts <= 10000  # Should find it within max attempts
     
-    def test_roll_with_impossible_target(self):
-        """Test rolling with impossible target."""
+    def test_roll_with_target_matches_roll_sequence(self):
+        """Test that the winning attempt is the same roll roll_single makes."""
         die = Die(sides=6)
-        group = DiceGroup(count=1, die=die)
-        expr = DiceExpression(dice_groups=[group])
+        group = DiceGroup(count=3, die=die)
+        expr = DiceExpression(dice_groups=[group], modifier=1)
+        
+        result, attempts = DiceRoller(seed=7).roll_with_target(expr, 17)
+        roller = DiceRoller(seed=7)
+        rolls = [roller.roll_single(expr) for _ in range(attempts)]
         
+        assert [roll.total for roll in rolls].index(17) == attempts - 1
+        assert result.individual_rolls == rolls[-1].individual_rolls
+        assert result.modifier == 1
+    
+    def test_roll_with_impossible_target(self, expr_1d6):
+        """Test rolling with impossible target."""
         roller = DiceRoller()
         
         # Too low
         with pytest.raises(ValueError):
-            roller.roll_with_target(expr, 0)
+            roller.roll_with_target(expr_1d6, 0)
         
         # Too high
         with pytest.raises(ValueError):
-            roller.roll_with_target(expr, 7)
+            roller.roll_with_target(expr_1d6, 7)
     
     def test_set_seed(self):
         """Test setting seed."""
@@ -138,17 +181,13 @@ class TestDiceRoller:
         roller.set_seed(123)
         assert roller.seed == 123
     
-    def test_reproducible_results(self):
+    def test_reproducible_results(self, expr_1d6):
         """Test that same seed produces same results."""
-        die = Die(sides=6)
-        group = DiceGroup(count=1, die=die)
-        expr = DiceExpression(dice_groups=[group])
-        
         roller1 = DiceRoller(seed=42)
         roller2 = DiceRoller(seed=42)
         
-        result1 = roller1.roll_single(expr)
-        result2 = roller2.roll_single(expr)
+        result1 = roller1.roll_single(expr_1d6)
+        result2 = roller2.roll_single(expr_1d6)
         
         assert result1.total == result2.total
         assert result1.individual_rolls == result2.individual_rolls
@@ -187,48 +226,47 @@ class TestDiceSimulator:
         simulator_with_seed = DiceSimulator(seed=42)
         assert simulator_with_seed.roller.seed == 42
     
-    def test_simulate_outcomes(self):
+    def test_simulate_outcomes(self, seeded_simulator, expr_1d6):
         """Test simulating many outcomes."""
-        expr = parse_dice_expression("d6")
-        simulator = DiceSimulator(seed=42)
-        
-        outcomes = simulator.simulate_outcomes(expr, 1000)
+        outcomes = seeded_simulator.simulate_outcomes(expr_1d6, 200)
         
         assert isinstance(outcomes, dict)
         assert all(1 <= value <= 6 for value in outcomes.keys())
-        assert sum(outcomes.values()) == 1000
+        assert sum(outcomes.values()) == 200
         
         # Each outcome should appear roughly equally
         for value in range(1, 7):
             assert value in outcomes
+            assert 20 <= outcomes[value] <= 60  # Rough bounds
+    
+    @pytest.mark.slow
+    def test_simulate_outcomes_many_iterations(self, seeded_simulator, expr_1d6):
+        """Test simulating many outcomes with tighter bounds."""
+        outcomes = seeded_simulator.simulate_outcomes(expr_1d6, 1000)
+        
+        assert sum(outcomes.values()) == 1000
+        for value in range(1, 7):
             assert 100 <= outcomes[value] <= 300  # Rough bounds
     
-    def test_find_probability_empirical(self):
+    def test_find_probability_empirical(self, seeded_simulator, expr_1d6):
         """Test finding empirical probability."""
-        expr = parse_dice_expression("d6")
-        simulator = DiceSimulator(seed=42)
-        
         # Test valid target
-        prob = simulator.find_probability_empirical(expr, 3, 1000)
+        prob = seeded_simulator.find_probability_empirical(expr_1d6, 3, 300)
         assert 0.0 <= prob <= 1.0
         assert 0.1 <= prob <= 0.25  # Should be around 1/6
         
         # Test impossible target
-        prob_impossible = simulator.find_probability_empirical(expr, 10, 1000)
+        prob_impossible = seeded_simulator.find_probability_empirical(expr_1d6, 10, 300)
         assert prob_impossible == 0.0
     
-    def test_compare_expressions(self):
+    def test_compare_expressions(self, seeded_simulator, expr_1d6, expr_1d8):
         """Test comparing two expressions."""
-        expr1 = parse_dice_expression("d6")
-        expr2 = parse_dice_expression("d8")
-        simulator = DiceSimulator(seed=42)
-        
-        comparison = simulator.compare_expressions(expr1, expr2, 1000)
+        comparison = seeded_simulator.compare_expressions(expr_1d6, expr_1d8, 300)
         
         assert comparison["expression1"] == "1d6"
         assert comparison["expression2"] == "1d8"
-        assert comparison["iterations"] == 1000
-        assert comparison["expr1_wins"] + comparison["expr2_wins"] + comparison["ties"] == 1000
+        assert comparison["iterations"] == 300
+        assert comparison["expr1_wins"] + comparison["expr2_wins"] + comparison["ties"] == 300
         assert 0.0 <= comparison["expr1_win_rate"] <= 1.0
         assert 0.0 <= comparison["expr2_win_rate"] <= 1.0
         assert 0.0 <= comparison["tie_rate"] <= 1.0
@@ -237,16 +275,41 @@ class TestDiceSimulator:
         assert comparison["expr2_win_rate"] > comparison["expr1_win_rate"]
         assert comparison["expr2_avg"] > comparison["expr1_avg"]
     
-    def test_edge_cases(self):
+    def test_edge_cases(self, seeded_simulator):
         """Test edge cases."""
         # Test with very small number of iterations
         expr = parse_dice_expression("d6")
-        simulator = DiceSimulator(seed=42)
         
-        outcomes = simulator.simulate_outcomes(expr, 1)
+        outcomes = seeded_simulator.simulate_outcomes(expr, 1)
         assert sum(outcomes.values()) == 1
         
         # Test with expression that always gives same result
         expr = parse_dice_expression("d1")  # Always rolls 1
-        outcomes = simulator.simulate_outcomes(expr, 100)
-        assert outcomes == {1: 100}
\ No newline at end of file
+        outcomes = seeded_simulator.simulate_outcomes(expr, 100)
+        assert outcomes == {1: 100}
+    
+    def test_seeded_results_are_cached(self):
+        """Test that seeded simulations are memoized and deterministic."""
+        expr = parse_dice_expression("2d6")
+        simulator = DiceSimulator(seed=42)
+        
+        first = simulator.simulate_outcomes(expr, 500)
+        assert simulator.simulate_outcomes(expr, 500) == first
+        assert DiceSimulator(seed=42).simulate_outcomes(expr, 500) == first
+        assert len(simulator._cache) == 1
+        
+        # Callers get copies, not the cached dict
+        first[7] = -1
+        assert simulator.simulate_outcomes(expr, 500)[7] != -1
+        
+        simulator.clear_cache()
+        assert len(simulator._cache) == 0
+    
+    def test_unseeded_results_are_not_cached(self):
+        """Test that unseeded simulations always roll again."""
+        expr = parse_dice_expression("d6")
+        simulator = DiceSimulator()
+        
+        simulator.simulate_outcomes(expr, 10)
+        simulator.find_probability_empirical(expr, 3, 10)
+        assert len(simulator._cache) == 0
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""Tests for exact probability calculations."""
+
+import itertools
+
+import pytest
+
+from dice_average.parser import parse_dice_expression
+from dice_average.roller import DiceSimulator
+from dice_average.statistics import (
+    DiceStatistics, calculate_distribution, exact_probability
+)
+
+
+class TestDiceStatistics:
+    """Test exact distribution calculations."""
+    
+    def test_single_die_distribution(self, expr_1d6):
+        """Test that a single die is uniform."""
+        distribution = DiceStatistics.calculate_distribution(expr_1d6)
+        
+        assert list(distribution.keys()) == [1, 2, 3, 4, 5, 6]
+        assert all(p == pytest.approx(1 / 6) for p in distribution.values())
+    
+    def test_two_dice_distribution(self, expr_2d6):
+        """Test the classic 2d6 triangle."""
+        distribution = DiceStatistics.calculate_distribution(expr_2d6)
+        
+        assert list(distribution.keys()) == list(range(2, 13))
+        assert distribution[7] == pytest.approx(6 / 36)
+        assert distribution[2] == pytest.approx(1 / 36)
+        assert distribution[12] == pytest.approx(1 / 36)
+    
+    def test_distribution_with_modifier_and_groups(self):
+        """Test mixed groups and a modifier shift the support."""
+        expr = parse_dice_expression("1d4+1d6-2")
+        distribution = DiceStatistics.calculate_distribution(expr)
+        
+        assert min(distribution) == expr.min_value
+        assert max(distribution) == expr.max_value
+        assert sum(distribution.values()) == pytest.approx(1.0)
+        
+        mean = sum(total * p for total, p in distribution.items())
+        assert mean == pytest.approx(expr.average_value)
+    
+    def test_large_expression(self):
+        """Test that large expressions are computed exactly and quickly."""
+        expr = parse_dice_expression("100d100")
+        distribution = DiceStatistics.calculate_distribution(expr)
+        
+        assert len(distribution) == expr.max_value - expr.min_value + 1
+        assert distribution[100] == pytest.approx(100.0 ** -100)
+        assert sum(distribution.values()) == pytest.approx(1.0)
+    
+    def test_group_distribution_matches_enumeration(self):
+        """Test the closed-form group counts against brute-force enumeration."""
+        for count in range(1, 5):
+            for sides in range(1, 8):
+                expected = [0] * (count * (sides - 1) + 1)
+                for rolls in itertools.product(range(sides), repeat=count):
+                    expected[sum(rolls)] += 1
+                
+                assert DiceStatistics._group_ways(sides, count) == tuple(expected)
+    
+    def test_packed_convolution_matches_direct(self):
+        """Test that big-integer convolution gives the same counts."""
+        first = DiceStatistics._group_ways(6, 10)
+        second = DiceStatistics._group_ways(8, 5)
+        
+        packed = DiceStatistics._packed_convolve(first, second)
+        assert len(first) * len(second) >= DiceStatistics.PACKED_CONVOLUTION_THRESHOLD
+        assert sum(packed) == 6 ** 10 * 8 ** 5
+        
+        direct = [0] * (len(first) + len(second) - 1)
+        for i, a in enumerate(first):
+            for j, b in enumerate(second):
+                direct[i + j] += a * b
+        assert packed == direct
+    
+    def test_distribution_cached(self):
+        """Test that repeated expressions reuse the cached distribution."""
+        first = DiceStatistics.calculate_distribution(parse_dice_expression("4d6+1"))
+        first[5] = -1.0
+        
+        second = DiceStatistics.calculate_distribution(parse_dice_expression("4d6 + 1"))
+        assert second[5] == pytest.approx(1 / 6 ** 4)
+        assert DiceStatistics._cached_distribution.cache_info().hits >= 1
+    
+    def test_exact_probability(self, expr_3d6):
+        """Test exact probability lookups."""
+        assert DiceStatistics.exact_probability(expr_3d6, 10) == pytest.approx(27 / 216)
+        assert DiceStatistics.exact_probability(expr_3d6, 2) == 0.0
+        assert DiceStatistics.exact_probability(expr_3d6, 19) == 0.0
+        assert DiceStatistics.exact_probability(expr_3d6, 10.5) == 0.0
+    
+    def test_matches_empirical_probability(self, expr_2d6):
+        """Test that simulation agrees with the exact value."""
+        simulator = DiceSimulator(seed=42)
+        
+        empirical = simulator.find_probability_empirical(expr_2d6, 7, 10000)
+        assert empirical == pytest.approx(exact_probability(expr_2d6, 7), abs=0.02)
+
+
+class TestConvenienceFunctions:
+    """Test convenience functions."""
+    
+    def test_calculate_distribution(self):
+        """Test calculate_distribution convenience function."""
+        expr = parse_dice_expression("d20+5")
+        distribution = calculate_distribution(expr)
+        
+        assert min(distribution) == 6
+        assert max(distribution) == 25
+    
+    def test_exact_probability(self, expr_1d8):
+        """Test exact_probability convenience function."""
+        assert exact_probability(expr_1d8, 3) == pytest.approx(1 / 8)
\ No newline at end of file